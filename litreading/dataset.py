@@ -151,14 +151,18 @@ class Dataset:
         """
         Return pandas series of differ_lists
         Apply self.longest_common_subsequence() to two self.df columns
+        Each distinct pair of strings is only compared once, then reused for repeated rows
         Create a new column in df for the number of common words.
         """
         logger.debug("Comparing %s to %s", col_1, col_2)
         if not (isinstance(col_1, str) and isinstance(col_2, str)):
             logger.error("col_1 and col_2 should be strings from data columns headers")
-        temp = self.data.apply(
-            lambda x: self.longest_common_subsequence(x[col_1], x[col_2]), axis=1
-        )
+        pairs = list(zip(self.data[col_1], self.data[col_2]))
+        differ_lists = {}
+        for pair in pairs:
+            if pair not in differ_lists:
+                differ_lists[pair] = self.longest_common_subsequence(*pair)
+        temp = pd.Series([differ_lists[pair] for pair in pairs], index=self.data.index)
         if not inplace:
             return pd.Series(temp, name="differ_list")
         else:
@@ -242,10 +246,15 @@ class Dataset:
             ],
         )
         features.drop(columns=["errors_dict"], inplace=True)
-        features["asr_word_count"] = self.data[self.asr_col].apply(
-            lambda x: len(x.split())
+        # features has a RangeIndex: every column is matched to data by position
+        features["asr_word_count"] = (
+            self.data[self.asr_col].apply(lambda x: len(x.split())).to_numpy()
         )
-        features = features.div(self.data[self.duration_col] / 60, axis=0)
+        # divide counts by duration in minutes on the raw arrays, row by row
+        duration_min = self.data[self.duration_col].to_numpy(dtype=np.float64) / 60
+        with np.errstate(divide="ignore", invalid="ignore"):
+            counts_pm = features.to_numpy(dtype=np.float64) / duration_min[:, None]
+        features = pd.DataFrame(counts_pm, columns=features.columns)
         features = features.add_suffix("_pm")
         temp_prompt = self.data[self.prompt_col].apply(self.stats_length_of_words)
         temp_prompt = pd.DataFrame(
@@ -258,7 +267,7 @@ class Dataset:
         )
         features = pd.concat([features, temp_prompt, temp_asr], axis=1)
         if self.mode == "train":
-            features["human_wcpm"] = self.data[self.human_wcpm_col]
+            features["human_wcpm"] = self.data[self.human_wcpm_col].to_numpy()
         self.features = features
         if not inplace:
             return self.features
@@ -302,13 +311,15 @@ len(human_transcript) above which the row is considered an outlier
             return
         stats = pd.DataFrame(Y_pred, columns=["wcpm_estimation"], index=test_idx)
         stats["human_wcpm"] = self.data[self.human_wcpm_col].loc[test_idx]
-        stats["wcpm_estimation_error"] = stats["human_wcpm"] - stats["wcpm_estimation"]
-        stats["wcpm_estimation_abs_error"] = stats["wcpm_estimation_error"].abs()
-        stats["wcpm_estimation_error_%"] = np.where(
-            stats["human_wcpm"] != 0,
-            stats["wcpm_estimation_error"] / stats["human_wcpm"],
-            0,
+        # errors computed once on the raw arrays, abs values derived from them
+        human_wcpm = stats["human_wcpm"].to_numpy(dtype=np.float64)
+        error = human_wcpm - stats["wcpm_estimation"].to_numpy(dtype=np.float64)
+        error_pct = np.divide(
+            error, human_wcpm, out=np.zeros_like(error), where=human_wcpm != 0
         )
-        stats["wcpm_estimation_abs_error_%"] = stats["wcpm_estimation_error_%"].abs()
-        stats["RMSE"] = stats["wcpm_estimation_error"] ** 2
+        stats["wcpm_estimation_error"] = error
+        stats["wcpm_estimation_abs_error"] = np.abs(error)
+        stats["wcpm_estimation_error_%"] = error_pct
+        stats["wcpm_estimation_abs_error_%"] = np.abs(error_pct)
+        stats["RMSE"] = np.multiply(error, error)
         return stats
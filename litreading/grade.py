@@ -4,9 +4,11 @@ DataGrader class to predict WCPM
 
 import os
 import errno
+import copy
 
 import numpy as np
 import pandas as pd
+from sklearn.pipeline import Pipeline
 
 from litreading.utils import logger, save_file, open_file, BaselineModel
 from litreading.dataset import Dataset
@@ -20,21 +22,43 @@ from litreading.config import (
 )
 
 # main function
-def grade_wcpm(df, only_wcpm=False):
+def grade_wcpm(df, only_wcpm=False, n_jobs=None):
     """ Instanciate Datagrader and grade """
-    data = DataGrader(df)
+    data = DataGrader(df, n_jobs=n_jobs)
     return data.grade_wcpm(only_wcpm=only_wcpm)
 
 
+def grade_wcpm_batch(dfs, only_wcpm=False, n_jobs=None):
+    """
+    Grade several DataFrames at once with a single DataGrader and model call
+    Return a list of grades, one per DataFrame in dfs, each with its original index
+    Prefer this to many grade_wcpm calls on small (e.g. single-row) DataFrames
+    """
+    dfs = list(dfs)
+    if len(dfs) == 0:
+        return []
+    bounds = np.cumsum([0] + [len(df) for df in dfs])
+    grades = grade_wcpm(
+        pd.concat(dfs, ignore_index=True), only_wcpm=only_wcpm, n_jobs=n_jobs
+    )
+    return [
+        grades.iloc[start:end].set_axis(df.index)
+        for df, start, end in zip(dfs, bounds[:-1], bounds[1:])
+    ]
+
+
 class DataGrader(Dataset):
     """
     Grader tool
-    Methods: set_model
+    Methods: set_model, set_n_jobs
             grade_wcpm: will run Dataset.preprocessing, Dataset.compute_features and self.estimate_wcpm
             estimate_wcpm: use the model on Dataset.features to estimate wcpm
-    Static methods: __load_model
+    Static methods: __load_model, __set_model_threads
+    Class attributes: _MODEL_CACHE: (mtime, model) already loaded from disk, by (path, n_jobs)
     """
 
+    _MODEL_CACHE = {}
+
     def __init__(
         self,
         df,
@@ -42,6 +66,7 @@ class DataGrader(Dataset):
         asr_col="asr_transcript",
         duration_col="scored_duration",
         model_type=DEFAULT_MODEL_TYPE,
+        n_jobs=None,
     ):
         Dataset.__init__(
             self,
@@ -52,38 +77,91 @@ class DataGrader(Dataset):
             mode="predict",
         )
         self.scaler = self.__load_model(DEFAULT_MODEL_FILES["StandardScaler"])
+        self._mean32 = np.ascontiguousarray(self.scaler.mean_, dtype=np.float32)
+        self._inv_scale32 = np.ascontiguousarray(
+            1.0 / self.scaler.scale_, dtype=np.float32
+        )
+        # float32 buffer for scaled features, reused across estimations
+        self._feature_buf = None
+        self.n_jobs = n_jobs
         self.model_type = None
         self.set_model(model_type)
 
     @staticmethod
-    def __load_model(model_file, print_info=False):
-        """ Used to load scaler or model using utils.open_file() """
-        model_path = MODELS_PATH + model_file
-        if print_info:
-            logger.info("Loading model from %s", model_path)
-        model = open_file(model_path)
+    def __load_model(model_file, print_info=False, n_jobs=None):
+        """
+        Used to load scaler or model using utils.open_file()
+        Models are only read from disk once, then reused from DataGrader._MODEL_CACHE \
+until the file is modified
+        If n_jobs is not None, return a copy of the model set to predict with n_jobs threads. \
+Cached models are never modified, so graders sharing them do not interfere.
+        """
+        model_path = os.path.abspath(MODELS_PATH + model_file)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(model_path)
+        mtime = os.path.getmtime(model_path)
+        key = (model_path, n_jobs)
+        cached_mtime, model = DataGrader._MODEL_CACHE.get(key, (None, None))
+        if cached_mtime != mtime:
+            if n_jobs is None:
+                if print_info:
+                    logger.info("Loading model from %s", model_path)
+                model = open_file(model_path)
+            else:
+                model = copy.deepcopy(
+                    DataGrader.__load_model(model_file, print_info=print_info)
+                )
+                DataGrader.__set_model_threads(model, n_jobs)
+            DataGrader._MODEL_CACHE[key] = (mtime, model)
         return model
 
+    @staticmethod
+    def __set_model_threads(model, n_jobs):
+        """ Set the number of threads model predicts with, if it has such a param """
+        if hasattr(model, "get_booster"):
+            model.get_booster().set_param("nthread", n_jobs)
+        if "n_jobs" in model.get_params():
+            model.set_params(n_jobs=n_jobs)
+
     def set_model(self, model_type):
         """Change model to another one
         input: model_type: 'RF' or 'XGB'
+        If the saved model is a sklearn Pipeline, scaling is owned by the pipeline \
+and features are passed to it unscaled.
         """
-        if self.model_type is model_type:
-            pass  # no changes if same model wanted
-        else:  # to be improved
-            if model_type == "Baseline":
-                self.model = BaselineModel()
-            elif model_type in AVAILABLE_MODEL_TYPES:
-                self.model = self.__load_model(
-                    DEFAULT_MODEL_FILES[model_type], print_info=True
-                )
-            else:
-                raise AttributeError(
-                    "No such model is available. \
+        if model_type == self.model_type:
+            return  # no changes if same model wanted
+        if model_type not in AVAILABLE_MODEL_TYPES:
+            raise AttributeError(
+                "No such model is available. \
 Please choose in '%s'."
-                    % "', '".join(AVAILABLE_MODEL_TYPES)
-                )
-            self.model_type = model_type
+                % "', '".join(AVAILABLE_MODEL_TYPES)
+            )
+        self.__load_model_type(model_type)
+
+    def set_n_jobs(self, n_jobs):
+        """Change the number of threads the model predicts with
+        input: n_jobs: number of threads, -1 for all cores, None for the saved model setting
+        RF, XGB and KNN parallelize predict internally, this has no effect on others
+        """
+        if n_jobs == self.n_jobs:
+            return  # no changes if same setting wanted
+        self.n_jobs = n_jobs
+        self.__load_model_type(self.model_type)
+
+    def __load_model_type(self, model_type):
+        """ Load the model of type model_type, predicting with self.n_jobs threads """
+        if model_type == "Baseline":
+            self.model = BaselineModel()
+        else:
+            self.model = self.__load_model(
+                DEFAULT_MODEL_FILES[model_type], print_info=True, n_jobs=self.n_jobs
+            )
+        self.model_type = model_type
+        # raw xgboost booster, to predict without the sklearn wrapper
+        self._booster = (
+            self.model.get_booster() if hasattr(self.model, "get_booster") else None
+        )
 
     def grade_wcpm(self, only_wcpm=False):
         """preprocess, compute features and give grade all in one function """
@@ -98,11 +176,37 @@ Please choose in '%s'."
     def estimate_wcpm(self, inplace=False):
         """ Scale features, use current model to estimate the wcpm """
         logger.debug("Estimating wcpm")
-        self.features = self.scaler.transform(self.features)
-        wcpm = self.model.predict(self.features)
-        wcpm = pd.Series(wcpm, name="wcpm_estimation")
-        wcpm = wcpm.apply(lambda x: round(x, 1))
+        if isinstance(self.model, Pipeline):
+            pass  # scaling, if any, is a step of the pipeline
+        elif self.model_type == "XGB":
+            # xgboost works in float32 anyway: scale at that precision into the buffer
+            X = np.asarray(self.features)
+            if self._feature_buf is None or self._feature_buf.shape != X.shape:
+                self._feature_buf = np.empty(X.shape, dtype=np.float32)
+            np.subtract(
+                X,
+                self._mean32,
+                out=self._feature_buf,
+                dtype=np.float32,
+                casting="same_kind",
+            )
+            self._feature_buf *= self._inv_scale32
+            self.features = self._feature_buf
+        else:
+            # one explicit conversion to a float64 array, then scale it in place
+            X = np.array(self.features, dtype=np.float64, order="C")
+            self.features = self.scaler.transform(X, copy=False)
+        if (
+            self._booster is not None
+            and isinstance(self.features, np.ndarray)
+            and self.features.dtype == np.float32
+        ):
+            wcpm = self._booster.inplace_predict(self.features)
+        else:
+            wcpm = self.model.predict(self.features)
+        wcpm = np.asarray(wcpm, dtype=np.float64)
+        np.round(wcpm, 1, out=wcpm)
         if not inplace:
-            return wcpm
+            return pd.Series(wcpm, name="wcpm_estimation")
         else:
             self.data["wcpm_estimation"] = wcpm
@@ -4,10 +4,6 @@ ModelTrainer class to train models and / or tune hyperparameters
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
-import seaborn as sns
-import itertools
 
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestRegressor
@@ -209,19 +205,24 @@ set before training by calling ModelTrainer.prepare_train_test_set()"
         )
         stats["wcpm_bin"] = stats["human_wcpm"].apply(assign_wcpm_bin)
         # computing mean and std of stats for each bin
-        stats_summary = stats.groupby("wcpm_bin").agg(["mean", "std"])
-        stats_summary.loc["total"] = stats.agg(["mean", "std"]).unstack()
-        # stats_summary = pd.concat([stats_summary, total], axis=0)
-        stats_summary.drop(
-            columns=["human_wcpm", "wcpm_estimation", "wcpm_estimation_error_%"],
-            inplace=True,
-        )
+        summary_cols = [
+            "wcpm_estimation_error",
+            "wcpm_estimation_abs_error",
+            "wcpm_estimation_abs_error_%",
+            "RMSE",
+        ]
+        stats_summary = stats.groupby("wcpm_bin")[summary_cols].agg(["mean", "std"])
+        # total mean and std in one pass over the raw values
+        values = stats[summary_cols].to_numpy(dtype=np.float64)
+        stats_summary.loc["total"] = np.column_stack(
+            (values.mean(axis=0), values.std(axis=0, ddof=1))
+        ).ravel()
         cols = [
             ("wcpm_estimation_abs_error_%", "mean"),
             ("wcpm_estimation_abs_error_%", "std"),
         ]
         stats_summary[cols] = stats_summary[cols] * 100
-        stats_summary = stats_summary.applymap(lambda x: round(x, 2))
+        stats_summary = stats_summary.round(2)
         # computing # of error > 1%, 5%, 10% per bin
         d = {
             "Total Count": -1,
@@ -229,9 +230,13 @@ set before training by calling ModelTrainer.prepare_train_test_set()"
             "Error > 5%": 0.05,
             "Error > 10%": 0.1,
         }
-        for k, v in d.items():
-            stats[k] = stats["wcpm_estimation_abs_error_%"] > v
-        agg_funcs = ["sum", lambda x: round(100 * sum(x) / len(x), 1)]
+        # all thresholds compared in one broadcast over the abs errors
+        abs_error_pct = stats["wcpm_estimation_abs_error_%"].to_numpy()
+        thresholds = np.array(list(d.values()))
+        errors_over = abs_error_pct[:, np.newaxis] > thresholds
+        for i, k in enumerate(d.keys()):
+            stats[k] = errors_over[:, i]
+        agg_funcs = ["sum", lambda x: round(100 * x.sum() / len(x), 1)]
         errors_summary = stats[list(d.keys()) + ["wcpm_bin"]].groupby("wcpm_bin")
         errors_summary = errors_summary.agg(agg_funcs)
         errors_summary.columns.set_levels(["count", "% of bin"], level=1, inplace=True)
@@ -273,8 +278,7 @@ set before training by calling ModelTrainer.prepare_train_test_set()"
             [print(key, value) for key, value in params.items()]
         print("\n" + " Params to be tested: ".center(120, "-"))
         [print(key, value) for key, value in params_grid.items()]
-        params_list = list(itertools.product(*params_grid.values()))
-        n_combi = len(params_list)
+        n_combi = int(np.prod([len(value) for value in params_grid.values()]))
         print(
             "\n"
             + " # of possible combinations to be cross-validated: {:d}".format(n_combi)
@@ -309,6 +313,9 @@ set before training by calling ModelTrainer.prepare_train_test_set()"
         For parameters x and hue using seaborn
         log_scale = True to plot with a log_scale on x axis
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         # Get Test Scores Mean and std for each grid search
         cv_results = pd.DataFrame(cv_results)
         if hue is not None:
@@ -337,24 +344,33 @@ set before training by calling ModelTrainer.prepare_train_test_set()"
             features: names of the features
             threshold: minimum feature importance for the feature to be plotted
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         importance = self.__model.feature_importances_
-        idx = [x[0] for x in enumerate(importance) if x[1] > threshold]
-        labels = self.features.columns[idx]
-        importance = importance[idx]
-        idx = np.argsort(importance)[::-1]
+        mask = importance > threshold
+        labels = self.features.columns.drop("human_wcpm").values[mask]
+        importance = importance[mask]
+        order = np.argsort(importance)[::-1]
+        importance, labels = importance[order], labels[order]
 
         plt.style.use("seaborn-darkgrid")
-        _, ax = plt.subplots(1, 1, figsize=(8, max(8, 0.2 * len(idx))))
-        sns.barplot(x=importance[idx], y=labels[idx], color=sns.color_palette()[0])
-        for i, val in enumerate(importance[idx]):
+        _, ax = plt.subplots(1, 1, figsize=(8, max(8, 0.2 * len(order))))
+        sns.barplot(x=importance, y=labels, color=sns.color_palette()[0])
+        for i, val in enumerate(importance):
             ax.text(val + 0.01, i, s="{:.3f}".format(val), ha="left", va="center")
         ax.set_title("Feature importance for current model", fontsize=16)
-        ax.set_xlim(0, max(importance[idx]) + 0.03)
+        max_importance = importance.max(initial=0)
+        ax.set_xlim(0, max_importance + 0.03)
         plt.show()
 
     @staticmethod
     def plot_wcpm_distribution(stats, x, stat="count", binwidth=0.01):
         """ Plot distribution of stats[stat] from x in bins of bin_width """
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+        import seaborn as sns
+
         plt.style.use("seaborn-darkgrid")
         _, ax = plt.subplots(1, 1, figsize=(16, 6))
         sns.histplot(ax=ax, data=stats, x=x, stat=stat, binwidth=binwidth)
@@ -371,6 +387,10 @@ set before training by calling ModelTrainer.prepare_train_test_set()"
         Scatter plot of x and y in stats to be choosen by user
         Default x='human_wcpm' and y='wcpm_estimation_error_%'
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+        import seaborn as sns
+
         plt.style.use("seaborn-darkgrid")
         _, ax = plt.subplots(1, 1, figsize=(16, 6))
         sns.scatterplot(data=stats, x=x, y=y)
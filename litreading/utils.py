@@ -8,9 +8,6 @@ import logging
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
-import seaborn as sns
 
 import joblib
 
@@ -82,6 +82,14 @@ def test_dataset_differ_list():
     assert df_test["differ_list"].equals(df)
 
 
+def test_dataset_differ_list_repeated_rows():
+    obj = Dataset(pd.concat([DF_TEST, DF_TEST], ignore_index=True))
+    obj.preprocess_data(inplace=True)
+    df = obj.compute_differ_lists(col_1="prompt", col_2="asr_transcript", inplace=False)
+    n = len(DF_TEST)
+    assert df.iloc[:n].tolist() == df.iloc[n:].tolist()
+
+
 def test_dataset_features():
     obj = Dataset(DF_TEST)
     obj.preprocess_data(inplace=True)
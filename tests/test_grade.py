@@ -2,7 +2,7 @@ import pandas as pd
 import pytest
 import os
 
-from litreading.grade import DataGrader, grade_wcpm
+from litreading.grade import DataGrader, grade_wcpm, grade_wcpm_batch
 from litreading.utils import save_file
 
 # logger.setLevel(logging.CRITICAL)
@@ -23,6 +23,29 @@ def test_grade_set_model():
     assert obj.model.__class__.__name__ == "BaselineModel"
 
 
+def test_grade_model_cache():
+    obj_1 = DataGrader(DF_TEST, model_type="RF")
+    obj_2 = DataGrader(DF_TEST, model_type="RF")
+    assert obj_1.model is obj_2.model
+    assert obj_1.scaler is obj_2.scaler
+
+
+def test_grade_set_n_jobs():
+    for model_type in ["RF", "XGB"]:
+        grades_test = DataGrader(DF_TEST, model_type=model_type).grade_wcpm(
+            only_wcpm=True
+        )
+        obj = DataGrader(DF_TEST, model_type=model_type, n_jobs=2)
+        assert obj.model.get_params()["n_jobs"] == 2
+        assert obj.grade_wcpm(only_wcpm=True).equals(grades_test)
+        # cached model shared by default graders is left untouched
+        default_obj = DataGrader(DF_TEST, model_type=model_type)
+        assert default_obj.model is not obj.model
+        assert default_obj.model.get_params()["n_jobs"] != 2
+        obj.set_n_jobs(None)
+        assert obj.model is default_obj.model
+
+
 def test_grade_estimate_wcpm():
     obj = DataGrader(DF_TEST, model_type="XGB")
     features = pd.read_csv(ABS_PATH + "/test_data/test_data_features.csv", sep=";")
@@ -40,3 +63,20 @@ def test_grade_grade_wcpm():
         ABS_PATH + "/test_data/test_data_wcpm_estimations.csv", sep=";"
     )
     grades.equals(grades_test["wcpm_estimation"])
+
+
+def test_grade_grade_wcpm_batch():
+    dfs = [DF_TEST.iloc[:3], DF_TEST.iloc[3:4], DF_TEST.iloc[4:]]
+    grades = grade_wcpm_batch(dfs, only_wcpm=True)
+    assert [len(g) for g in grades] == [len(df) for df in dfs]
+    assert pd.concat(grades).equals(grade_wcpm(DF_TEST, only_wcpm=True))
+    assert grade_wcpm_batch([]) == []
+
+
+def test_grade_grade_wcpm_non_range_index():
+    df = DF_TEST.set_index(DF_TEST.index + 100)
+    grades = grade_wcpm(df, only_wcpm=True)
+    assert grades.index.equals(df.index)
+    grades_test = grade_wcpm(DF_TEST, only_wcpm=True)
+    assert grades.notna().all()
+    assert (grades.to_numpy() == grades_test.to_numpy()).all()